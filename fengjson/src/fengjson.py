@@ -1,16 +1,268 @@
+import codecs
 import json
 import logging
+import mmap
 import os
-from typing import Dict, Optional, Union
-
-# 配置日志记录
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+import stat
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# orjson 为可选依赖，仅在调用方传入 use_orjson=True 时使用
+try:
+    import orjson as _fastjson
+except ImportError:
+    _fastjson = None  # type: ignore[assignment]
+
+# 日志记录：库本身不配置处理器，由调用方决定日志输出
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# 使用 orjson 解析时，超过该大小的文件经 mmap 直接解析，避免整份读入内存 (1 MiB)
+_MMAP_THRESHOLD = 1 << 20
+
+# 写文件时使用的缓冲区大小 (1 MiB)，减少大文件写入的系统调用次数
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# 小于该大小的输出一次性编码后用单次 os.write 写入 (64 KiB)
+_SMALL_WRITE_THRESHOLD = 64 * 1024
+
+# 解析结果缓存：键为 (绝对路径, mtime_ns, 文件大小, 编码, 是否使用 orjson)，按 LRU 淘汰
+_PARSE_CACHE_SIZE = 128
+_CacheKey = Tuple[str, int, int, str, bool]
+_parse_cache: "OrderedDict[_CacheKey, Dict[str, object]]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+# orjson 写入选项：2 空格缩进；datetime、dataclass 与子类交给 default 拒绝，再由标准库处理
+_ORJSON_OPTIONS = (_fastjson.OPT_INDENT_2 | _fastjson.OPT_PASSTHROUGH_DATETIME
+                   | _fastjson.OPT_PASSTHROUGH_DATACLASS | _fastjson.OPT_PASSTHROUGH_SUBCLASS) if _fastjson else 0
+
+# 按 (indent, ensure_ascii) 复用的 JSONEncoder 实例
+_ENCODERS: Dict[Tuple[Optional[int], bool], json.JSONEncoder] = {}
+
+# orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，这里一并捕获
+_JSONDecodeError = (json.JSONDecodeError, getattr(_fastjson, 'JSONDecodeError', json.JSONDecodeError))
+
+
+def _is_utf8(encoding: str) -> bool:
+    """判断编码是否为 UTF-8（UTF-8 字节可直接交给解析器，无需先解码为 str）"""
+    return codecs.lookup(encoding).name == 'utf-8'
+
+
+def _loads(content: Union[bytes, str], use_orjson: bool) -> object:
+    """解析 JSON；仅在 use_orjson 且已安装 orjson 时使用 orjson，否则使用标准库"""
+    if use_orjson and _fastjson:
+        return _fastjson.loads(content)
+    return json.loads(content)
+
+
+def _loads_mmap(file_path: str) -> object:
+    """通过 mmap 将文件映射到内存后直接解析（仅 orjson 支持 memoryview 输入）"""
+    with open(file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # 提示内核按顺序预读
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mm) as view:
+                return _fastjson.loads(view)
+
+
+def _cache_get(key: _CacheKey) -> Optional[Dict[str, object]]:
+    """从解析缓存中取出共享的结果对象，未命中返回 None"""
+    with _parse_cache_lock:
+        data: Optional[Dict[str, object]] = _parse_cache.get(key)
+        if data is not None:
+            _parse_cache.move_to_end(key)
+    return data
+
+
+def _cache_put(key: _CacheKey, data: Dict[str, object]) -> None:
+    """写入解析缓存，超出容量时淘汰最久未使用的条目"""
+    with _parse_cache_lock:
+        _parse_cache[key] = data
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+
+
+def _encoder(indent: Optional[int], ensure_ascii: bool) -> json.JSONEncoder:
+    """取得复用的 JSONEncoder，避免每次写入都重新构造"""
+    key = (indent, ensure_ascii)
+    encoder = _ENCODERS.get(key)
+    if encoder is None:
+        encoder = json.JSONEncoder(indent=indent, ensure_ascii=ensure_ascii)
+        _ENCODERS[key] = encoder
+    return encoder
+
+
+def _orjson_default(obj: object) -> object:
+    """orjson 无法按标准库方式处理的对象一律拒绝"""
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _orjson_dumps(data: Dict[str, object]) -> Optional[bytes]:
+    """用 orjson 编码为 2 空格缩进的 UTF-8 字节；遇到与标准库行为不一致的数据时返回 None"""
+    try:
+        return _fastjson.dumps(data, default=_orjson_default, option=_ORJSON_OPTIONS)
+    except _fastjson.JSONEncodeError:
+        return None
+
+
+def _tmp_path(file_path: str) -> str:
+    """生成与目标文件同目录的临时文件路径（同一文件系统内 os.replace 才是原子的）"""
+    return f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _create_file(path: str) -> int:
+    """创建（或截断）文件并返回文件描述符；父目录不存在时才创建目录，目录已存在时没有额外的系统调用"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        return os.open(path, flags, 0o666)
+    except FileNotFoundError:
+        dir_path = os.path.dirname(path)
+        if not dir_path:
+            raise
+        os.makedirs(dir_path, exist_ok=True)
+        return os.open(path, flags, 0o666)
+
+
+def _write_bytes(path: str, buf: bytes, fsync: bool) -> None:
+    """绕过 Python io 层，直接用 os.write 写入字节（小文件通常只需一次系统调用）"""
+    fd: int = _create_file(path)
+    try:
+        view: memoryview = memoryview(buf)
+        written: int = 0
+        while written < len(view):
+            written += os.write(fd, view[written:])
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_chunks(path: str, chunks: Iterator[str], encoding: str, fsync: bool) -> None:
+    """写入编码器产生的文本块：小输出合并后一次写入，大输出经 1 MiB 缓冲区流式写入"""
+    head: List[str] = []
+    size: int = 0
+    for chunk in chunks:
+        head.append(chunk)
+        size += len(chunk)
+        if size >= _SMALL_WRITE_THRESHOLD:
+            break
+    else:
+        _write_bytes(path, ''.join(head).encode(encoding), fsync)
+        return
+
+    # 已编码的部分先写入，其余逐块写入，不在内存中拼出完整字符串
+    with open(_create_file(path), 'w', encoding=encoding, buffering=_WRITE_BUFFER_SIZE) as file:
+        file.write(''.join(head))
+        for chunk in chunks:
+            file.write(chunk)
+        if fsync:
+            file.flush()
+            os.fsync(file.fileno())
+
+
+def _copy_mode(src: str, dst: str) -> None:
+    """目标文件已存在时，将其权限位复制到临时文件上"""
+    try:
+        st = os.stat(src)
+    except FileNotFoundError:
+        return
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+
+
+def _remove_quietly(path: str) -> None:
+    """删除文件，忽略文件不存在等错误"""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _read_dict(file_path: object,
+               encoding: str,
+               cache: bool,
+               use_orjson: bool) -> Tuple[bool, Optional[Dict[str, object]]]:
+    """
+    读取并解析 JSON 文件，供各公共读取函数共用
+
+    返回:
+        (False, None) → 参数错误、文件错误或解析错误
+        (True, None)  → 文件为空或 JSON 内容不是字典
+        (True, dict)  → 解析得到的字典
+    """
+    if type(file_path) is not str and not isinstance(file_path, str):
+        logger.error("文件路径必须是字符串，收到: %s", type(file_path))
+        return False, None
+
+    # 一次 stat 同时完成存在性检查、文件类型检查，并为后续取得文件大小
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        logger.error("文件不存在: %s", file_path)
+        return False, None
+    except (OSError, ValueError) as e:  # ValueError: 路径中包含空字符
+        logger.error("文件操作错误: %s", e)
+        return False, None
+
+    # 检查是否为文件
+    if not stat.S_ISREG(st.st_mode):
+        logger.error("路径不是文件: %s", file_path)
+        return False, None
+
+    try:
+        # 命中缓存时直接返回共享对象，跳过读取和解析
+        if cache:
+            cache_key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size, encoding, use_orjson)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return True, cached
+
+        if use_orjson and _fastjson and st.st_size >= _MMAP_THRESHOLD and _is_utf8(encoding):
+            # 大文件：mmap 后直接解析，省去一次完整拷贝
+            data: object = _loads_mmap(file_path)
+        else:
+            # 以二进制模式读取，UTF-8 字节直接交给解析器，省去一次解码
+            with open(file_path, 'rb') as file:
+                content: bytes = file.read()
+
+            # 检查文件是否为空（isspace 遇到首个非空白字节即返回，无需像 strip 那样复制内容）
+            if not content or content.isspace():
+                logger.warning("文件为空: %s", file_path)
+                return True, None
+
+            # 解析 JSON（非 UTF-8 编码仍按指定编码解码）
+            data = _loads(content if _is_utf8(encoding) else content.decode(encoding), use_orjson)
+
+        # 验证解析结果是否为字典
+        if type(data) is not dict and not isinstance(data, dict):
+            logger.warning("JSON 内容不是字典对象: %s", type(data))
+            return True, None
+
+        if cache:
+            _cache_put(cache_key, data)
+
+        return True, data
 
+    except UnicodeDecodeError as e:
+        logger.error("编码错误 (%s): %s", encoding, e)
+    except _JSONDecodeError as e:
+        logger.error("JSON 解析错误: %s", e)
+    except OSError as e:  # 包括文件权限问题等
+        logger.error("文件操作错误: %s", e)
+    except Exception as e:
+        logger.exception("未知错误: %s", e)
+    return False, None
 
-def read_json_to_dict(file_path: str,
+
+def read_json_to_dict(file_path: object,
                       encoding: str = 'utf-8',
-                      default: Optional[Dict] = None) -> Union[Dict, None]:
+                      default: object = None,
+                      cache: bool = False,
+                      use_orjson: bool = False) -> Union[Dict[str, object], None]:
     """
     将 JSON 文件安全地读取为 Python 字典
 
@@ -18,68 +270,38 @@ def read_json_to_dict(file_path: str,
         file_path: JSON 文件路径
         encoding: 文件编码 (默认: 'utf-8')
         default: 读取失败时返回的默认值 (默认: None)
+        cache: 是否缓存解析结果，文件修改后自动失效 (默认: False)。
+               启用后返回与缓存共享的同一个字典，调用方不应修改它（包括嵌套的值），
+               否则之后的读取都会得到被修改的结果
+        use_orjson: 已安装 orjson 时用其解析 (默认: False)。与标准库的差异：不接受 NaN/Infinity、
+                    超出范围的数字（如 1e400）和单独的代理字符转义，超出 64 位的整数会被解析为浮点数
 
     返回:
         JSON 解析后的字典，或出错时返回 default 值
     """
     # 验证输入参数
-    if not isinstance(file_path, str):
-        logger.error(f"文件路径必须是字符串，收到: {type(file_path)}")
-        return default
-
-    if default is not None and not isinstance(default, dict):
-        logger.error(f"默认值必须是字典类型，收到: {type(default)}")
+    if default is not None and type(default) is not dict and not isinstance(default, dict):
+        logger.error("默认值必须是字典类型，收到: %s", type(default))
         return None
 
-    # 检查文件是否存在
-    if not os.path.exists(file_path):
-        logger.error(f"文件不存在: {file_path}")
+    ok, data = _read_dict(file_path, encoding, cache, use_orjson)
+    if not ok:
         return default
 
-    # 检查是否为文件
-    if not os.path.isfile(file_path):
-        logger.error(f"路径不是文件: {file_path}")
-        return default
-
-    try:
-        # 打开并读取文件
-        with open(file_path, 'r', encoding=encoding) as file:
-            content = file.read()
-
-            # 检查文件是否为空
-            if not content.strip():
-                logger.warning(f"文件为空: {file_path}")
-                return default or {}
-
-            # 解析 JSON
-            data = json.loads(content)
+    # 文件为空或内容不是字典
+    if data is None:
+        return default or {}
 
-            # 验证解析结果是否为字典
-            if not isinstance(data, dict):
-                logger.warning(f"JSON 内容不是字典对象: {type(data)}")
-                return default or {}
+    return data
 
-            return data
 
-    except UnicodeDecodeError as e:
-        logger.error(f"编码错误 ({encoding}): {e}")
-        return default
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON 解析错误: {e}")
-        return default
-    except OSError as e:  # 包括文件权限问题等
-        logger.error(f"文件操作错误: {e}")
-        return default
-    except Exception as e:
-        logger.exception(f"未知错误: {e}")
-        return default
-
-
-def xiervjson(data: Dict,
-                       file_path: str,
-                       indent: int = 4,
+def xiervjson(data: object,
+                       file_path: object,
+                       indent: Optional[int] = 4,
                        encoding: str = 'utf-8',
-                       ensure_ascii: bool = False) -> bool:
+                       ensure_ascii: bool = False,
+                       fsync: bool = True,
+                       use_orjson: bool = False) -> bool:
     """
     将字典安全地写入 JSON 文件
 
@@ -89,54 +311,64 @@ def xiervjson(data: Dict,
         indent: JSON 缩进 (默认: 4)
         encoding: 文件编码 (默认: 'utf-8')
         ensure_ascii: 是否转义非 ASCII 字符 (默认: False)
+        fsync: 替换目标文件前是否将数据刷入磁盘，保证断电后不出现残缺文件 (默认: True)
+        use_orjson: indent 为 2、ensure_ascii 为 False 且编码为 UTF-8 时使用 orjson 加速写入 (默认: False)。
+                    与标准库的差异：NaN/Infinity 写为 null，浮点数格式不同（如 1e-7 与 1e-07），
+                    UUID、Enum 会被直接序列化；超出 64 位的整数、非字符串键、datetime、dataclass
+                    及 dict/str 等的子类会自动改用标准库编码
 
     返回:
         成功返回 True，失败返回 False
         :rtype: bool
     """
     # 验证输入参数
-    if not isinstance(data, dict):
-        logger.error(f"输入数据必须是字典类型，收到: {type(data)}")
+    if type(data) is not dict and not isinstance(data, dict):
+        logger.error("输入数据必须是字典类型，收到: %s", type(data))
         return False
 
-    if not isinstance(file_path, str):
-        logger.error(f"文件路径必须是字符串，收到: {type(file_path)}")
+    if type(file_path) is not str and not isinstance(file_path, str):
+        logger.error("文件路径必须是字符串，收到: %s", type(file_path))
         return False
 
-    # 创建目录（如果不存在）
-    dir_path = os.path.dirname(file_path)
-    if dir_path and not os.path.exists(dir_path):
-        try:
-            os.makedirs(dir_path, exist_ok=True)
-        except OSError as e:
-            logger.error(f"无法创建目录 {dir_path}: {e}")
-            return False
-
     try:
-        # 尝试序列化数据（提前检测是否可序列化）
-        json.dumps(data, indent=indent, ensure_ascii=ensure_ascii)
-
-        # 写入文件
-        with open(file_path, 'w', encoding=encoding) as file:
-            json.dump(data, file, indent=indent, ensure_ascii=ensure_ascii)
-
-        logger.info(f"成功写入 JSON 文件: {file_path}")
+        # 先写入同目录下的临时文件，成功后再替换目标文件，序列化失败不会留下残缺文件
+        # 目标为符号链接时写入其指向的文件，而不是用普通文件替换链接本身
+        real_path = os.path.realpath(file_path)
+        tmp_path = _tmp_path(real_path)
+        try:
+            buf: Optional[bytes] = None
+            if use_orjson and _fastjson and indent == 2 and not ensure_ascii and _is_utf8(encoding):
+                buf = _orjson_dumps(data)
+
+            if buf is not None:
+                _write_bytes(tmp_path, buf, fsync)
+            else:
+                _write_chunks(tmp_path, _encoder(indent, ensure_ascii).iterencode(data), encoding, fsync)
+            _copy_mode(real_path, tmp_path)
+            os.replace(tmp_path, real_path)
+        except BaseException:
+            _remove_quietly(tmp_path)
+            raise
+
+        logger.info("成功写入 JSON 文件: %s", file_path)
         return True
 
     except TypeError as e:
-        logger.error(f"数据类型不支持 JSON 序列化: {e}")
+        logger.error("数据类型不支持 JSON 序列化: %s", e)
         return False
     except OSError as e:
-        logger.error(f"文件写入错误: {e}")
+        logger.error("文件写入错误: %s", e)
         return False
     except Exception as e:
-        logger.exception(f"未知错误: {e}")
+        logger.exception("未知错误: %s", e)
         return False
 
 
-def json_to_dict(file_path: str,
-                 target_dict: Optional[dict] = None,
-                 encoding: str = 'utf-8') -> Union[dict, bool]:
+def json_to_dict(file_path: object,
+                 target_dict: object = None,
+                 encoding: str = 'utf-8',
+                 cache: bool = False,
+                 use_orjson: bool = False) -> Union[Dict[str, object], bool]:
     """
     处理JSON文件的通用函数
 
@@ -144,38 +376,90 @@ def json_to_dict(file_path: str,
         file_path: JSON文件路径
         target_dict: 可选的目标字典（用于更新）
         encoding: 文件编码
+        cache: 是否使用解析缓存。启用后返回模式得到的是与缓存共享的字典，
+               更新模式写入 target_dict 的值也与缓存共享（浅拷贝），调用方不应修改它们（包括嵌套的值）
+        use_orjson: 是否使用 orjson 解析（差异见 read_json_to_dict）
 
     返回:
-        如果target_dict为None → 返回新字典（失败时返回空字典）
+        如果target_dict为None → 返回新字典（失败时返回空字典；cache=True 时为共享的缓存字典）
         如果target_dict提供 → 成功返回True，失败返回False
     """
-    try:
-        # 读取文件
-        with open(file_path, 'r', encoding=encoding) as f:
-            data = json.load(f)
-
-        # 验证数据类型
-        if not isinstance(data, dict):
-            raise TypeError("JSON内容不是字典格式")
-
-        # 更新模式
-        if target_dict is not None:
-            if not isinstance(target_dict, dict):
-                raise TypeError("目标字典必须是dict类型")
-            target_dict.update(data)
-            return True
-
-        # 返回模式
+    # 更新模式下先校验目标字典，避免无谓的读取
+    if target_dict is not None and not isinstance(target_dict, dict):
+        logger.error("目标字典必须是dict类型")
+        return False
+
+    # 读取与解析与 read_json_to_dict 共用；空文件或非字典内容同样视为失败
+    _, data = _read_dict(file_path, encoding, cache, use_orjson)
+    if data is None:
+        return {} if target_dict is None else False
+
+    # 返回模式
+    if target_dict is None:
         return data
 
-    except FileNotFoundError:
-        logger.error(f"文件不存在: {file_path}")
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON解析错误: {e}")
-    except TypeError as e:
-        logger.error(str(e))
-    except Exception as e:
-        logger.error(f"未知错误: {e}")
+    # 更新模式
+    target_dict.update(data)
+    return True
+
+
+def bulk_merge(file_paths: Iterable[object],
+               target_dict: object = None,
+               encoding: str = 'utf-8',
+               cache: bool = False,
+               use_orjson: bool = False) -> Union[Dict[str, object], bool]:
+    """
+    将多个JSON文件依次合并到同一个字典（后读取的文件覆盖同名键）
+
+    参数:
+        file_paths: JSON文件路径列表
+        target_dict: 可选的目标字典（用于更新）
+        encoding: 文件编码
+        cache: 是否使用解析缓存。启用后合并结果中的值与缓存共享（浅拷贝），
+               调用方不应修改其中嵌套的列表、字典等值
+        use_orjson: 是否使用 orjson 解析（差异见 read_json_to_dict）
 
-    # 错误处理
-    return {} if target_dict is None else False
\ No newline at end of file
+    返回:
+        如果target_dict为None → 返回合并后的新字典
+        如果target_dict提供 → 全部合并成功返回True，任一文件失败、为空或不是字典时返回False（其余文件仍会合并）
+    """
+    if target_dict is not None and not isinstance(target_dict, dict):
+        logger.error("目标字典必须是dict类型")
+        return False
+
+    merged: Dict[str, object] = {} if target_dict is None else target_dict
+    update = merged.update
+    ok: bool = True
+    for file_path in file_paths:
+        _, data = _read_dict(file_path, encoding, cache, use_orjson)
+        if data is None:
+            ok = False
+            continue
+        update(data)
+
+    return merged if target_dict is None else ok
+
+
+def read_many(file_paths: Iterable[object],
+              encoding: str = 'utf-8',
+              default: object = None,
+              cache: bool = False,
+              max_workers: int = 4,
+              use_orjson: bool = False) -> List[Optional[Dict[str, object]]]:
+    """
+    使用线程池批量读取多个 JSON 文件，文件 IO 与解析相互重叠
+
+    参数:
+        file_paths: JSON 文件路径列表
+        encoding: 文件编码 (默认: 'utf-8')
+        default: 单个文件读取失败时返回的默认值 (默认: None)
+        cache: 是否使用解析缓存 (默认: False)。启用后返回的字典与缓存共享，调用方不应修改它们（包括嵌套的值）
+        max_workers: 线程数 (默认: 4)
+        use_orjson: 是否使用 orjson 解析，差异见 read_json_to_dict (默认: False)
+
+    返回:
+        与 file_paths 顺序一致的结果列表，每项同 read_json_to_dict 的返回值
+    """
+    read_one = partial(read_json_to_dict, encoding=encoding, default=default, cache=cache, use_orjson=use_orjson)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_one, file_paths))
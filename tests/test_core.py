@@ -3,11 +3,14 @@ import sys
 import os
 import tempfile
 import json
+import math
+from unittest import mock
 
 # 添加src到Python路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
-from fengjson.core import read_json_to_dict, xiervjson, json_to_dict
+from fengjson import core
+from fengjson.core import read_json_to_dict, xiervjson, json_to_dict, bulk_merge, read_many
 
 
 class TestReadJsonToDict(unittest.TestCase):
@@ -42,6 +45,15 @@ class TestReadJsonToDict(unittest.TestCase):
         
         self.assertEqual(result, {})
 
+    def test_read_whitespace_only_json(self):
+        """测试读取只包含空白字符的文件"""
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            f.write("  \n\t\n")
+        try:
+            self.assertEqual(read_json_to_dict(f.name), {})
+        finally:
+            os.unlink(f.name)
+
     def test_read_nonexistent_file(self):
         """测试读取不存在的文件"""
         result = read_json_to_dict("nonexistent_file.json")
@@ -59,6 +71,13 @@ class TestReadJsonToDict(unittest.TestCase):
         result = read_json_to_dict(file_path, encoding='utf-8')
         self.assertIsInstance(result, dict)
 
+    def test_read_gbk_json(self):
+        """测试读取 GBK 编码的文件"""
+        file_path = os.path.join(self.test_data_dir, 'gbk_json.json')
+        result = read_json_to_dict(file_path, encoding='gbk')
+
+        self.assertEqual(result, {"name": "国标编码", "city": "北京"})
+
     def test_invalid_file_path_type(self):
         """测试无效的文件路径类型"""
         result = read_json_to_dict(123)  # 非字符串路径
@@ -69,11 +88,48 @@ class TestReadJsonToDict(unittest.TestCase):
         result = read_json_to_dict("test.json", default="invalid")  # 非字典默认值
         self.assertIsNone(result)
 
+    def test_path_with_null_byte(self):
+        """测试路径中包含空字符"""
+        self.assertIsNone(read_json_to_dict("bad\0path.json"))
+        self.assertEqual(json_to_dict("bad\0path.json"), {})
+        self.assertFalse(json_to_dict("bad\0path.json", target_dict={}))
+
     def test_directory_instead_of_file(self):
         """测试传入目录而不是文件"""
         result = read_json_to_dict(self.test_data_dir)
         self.assertIsNone(result)
 
+    def test_read_large_json(self):
+        """测试读取超过 mmap 阈值的大文件"""
+        large_data = {f"key_{i}": "大文件测试" * 10 for i in range(30000)}
+        with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8', delete=False) as f:
+            json.dump(large_data, f, ensure_ascii=False)
+        try:
+            self.assertGreaterEqual(os.path.getsize(f.name), 1 << 20)
+            for use_orjson in (False, True):
+                result = read_json_to_dict(f.name, use_orjson=use_orjson)
+                self.assertEqual(result, large_data)
+        finally:
+            os.unlink(f.name)
+
+    def test_read_with_cache(self):
+        """测试缓存读取：命中时跳过读取和解析，文件修改后缓存失效"""
+        with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8', delete=False) as f:
+            json.dump({"version": 1}, f)
+        try:
+            first = read_json_to_dict(f.name, cache=True)
+            with mock.patch('builtins.open', side_effect=AssertionError("缓存命中时不应读取文件")), \
+                    mock.patch.object(core, '_loads', side_effect=AssertionError("缓存命中时不应解析")):
+                second = read_json_to_dict(f.name, cache=True)
+            self.assertIs(second, first)
+            self.assertEqual(second, {"version": 1})
+
+            with open(f.name, 'w', encoding='utf-8') as out:
+                json.dump({"version": 2, "changed": True}, out)
+            self.assertEqual(read_json_to_dict(f.name, cache=True), {"version": 2, "changed": True})
+        finally:
+            os.unlink(f.name)
+
 
 class TestXiervjson(unittest.TestCase):
     """测试 xiervjson 函数"""
@@ -123,11 +179,87 @@ class TestXiervjson(unittest.TestCase):
         self.assertFalse(result)
         self.assertFalse(os.path.exists(file_path))
 
+    def test_write_non_serializable_data(self):
+        """测试写入不可序列化的数据时不破坏已有文件"""
+        file_path = os.path.join(self.temp_dir, 'test.json')
+        self.assertTrue(xiervjson(self.test_data, file_path))
+
+        result = xiervjson({"valid": "data", "invalid": object()}, file_path)
+
+        self.assertFalse(result)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), self.test_data)
+        self.assertEqual(os.listdir(self.temp_dir), ['test.json'])  # 不残留临时文件
+
+    def test_write_large_data(self):
+        """测试写入超过 64 KiB 的数据（流式写入分支）"""
+        file_path = os.path.join(self.temp_dir, 'large.json')
+        data = {f"key_{i}": f"值_{i}" * 10 for i in range(5000)}
+        expected = json.dumps(data, indent=4, ensure_ascii=False)
+        self.assertGreater(len(expected.encode('utf-8')), core._SMALL_WRITE_THRESHOLD)
+
+        self.assertTrue(xiervjson(data, file_path))
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), expected)
+
+    def test_write_large_non_serializable_data(self):
+        """测试流式写入中途失败时不破坏已有文件"""
+        file_path = os.path.join(self.temp_dir, 'test.json')
+        self.assertTrue(xiervjson(self.test_data, file_path))
+        data = {f"key_{i}": "x" * 100 for i in range(2000)}
+        data["invalid"] = object()  # 位于前 64 KiB 之后
+
+        result = xiervjson(data, file_path)
+
+        self.assertFalse(result)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), self.test_data)
+        self.assertEqual(os.listdir(self.temp_dir), ['test.json'])  # 不残留临时文件
+
+    @unittest.skipIf(os.name == 'nt', "依赖 POSIX 权限位")
+    def test_write_keeps_existing_mode(self):
+        """测试覆盖已有文件时保留其权限"""
+        file_path = os.path.join(self.temp_dir, 'private.json')
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write('{}')
+        os.chmod(file_path, 0o600)
+
+        self.assertTrue(xiervjson(self.test_data, file_path))
+        self.assertEqual(os.stat(file_path).st_mode & 0o777, 0o600)
+
+    @unittest.skipIf(os.name == 'nt', "依赖符号链接")
+    def test_write_through_symlink(self):
+        """测试目标为符号链接时写入链接指向的文件"""
+        real_path = os.path.join(self.temp_dir, 'real.json')
+        link_path = os.path.join(self.temp_dir, 'link.json')
+        with open(real_path, 'w', encoding='utf-8') as f:
+            f.write('{}')
+        os.symlink(real_path, link_path)
+
+        self.assertTrue(xiervjson(self.test_data, link_path))
+        self.assertTrue(os.path.islink(link_path))
+        with open(real_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), self.test_data)
+
+    def test_write_without_fsync(self):
+        """测试关闭 fsync 写入"""
+        file_path = os.path.join(self.temp_dir, 'no_fsync.json')
+        result = xiervjson(self.test_data, file_path, fsync=False)
+
+        self.assertTrue(result)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), self.test_data)
+
     def test_write_with_invalid_file_path(self):
         """测试使用无效文件路径"""
         result = xiervjson(self.test_data, 123)  # 非字符串路径
         self.assertFalse(result)
 
+    def test_write_path_with_null_byte(self):
+        """测试路径中包含空字符"""
+        self.assertFalse(xiervjson(self.test_data, os.path.join(self.temp_dir, "bad\0path.json")))
+
     def test_write_with_special_characters(self):
         """测试写入包含特殊字符的数据"""
         test_data = {
@@ -157,6 +289,38 @@ class TestXiervjson(unittest.TestCase):
             content = f.read()
         self.assertIn('\n  "', content)  # 检查缩进
 
+    def test_write_indent_2_keeps_nan(self):
+        """测试默认（不启用 orjson）时 NaN/Infinity 按标准库写出"""
+        test_data = {"nan": float('nan'), "inf": float('inf')}
+        file_path = os.path.join(self.temp_dir, 'nan.json')
+
+        self.assertTrue(xiervjson(test_data, file_path, indent=2))
+        with open(file_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), json.dumps(test_data, indent=2))
+
+    def test_write_with_orjson(self):
+        """测试启用 orjson 写入时输出与标准库一致"""
+        file_path = os.path.join(self.temp_dir, 'orjson.json')
+        result = xiervjson(self.test_data, file_path, indent=2, use_orjson=True)
+
+        self.assertTrue(result)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), json.dumps(self.test_data, indent=2, ensure_ascii=False))
+
+    def test_write_with_orjson_falls_back_to_stdlib(self):
+        """测试 orjson 无法按标准库方式处理的数据改用标准库编码"""
+        import datetime
+        test_data = {"big": 2 ** 70, 1: "非字符串键"}
+        file_path = os.path.join(self.temp_dir, 'fallback.json')
+
+        self.assertTrue(xiervjson(test_data, file_path, indent=2, use_orjson=True))
+        with open(file_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), json.dumps(test_data, indent=2, ensure_ascii=False))
+
+        # 标准库不支持的类型仍然写入失败
+        result = xiervjson({"date": datetime.date(2024, 1, 1)}, file_path, indent=2, use_orjson=True)
+        self.assertFalse(result)
+
 
 class TestJsonToDict(unittest.TestCase):
     """测试 json_to_dict 函数"""
@@ -192,6 +356,20 @@ class TestJsonToDict(unittest.TestCase):
         result = json_to_dict("nonexistent.json", target_dict=target_dict)
         self.assertFalse(result)  # 更新模式返回False
 
+    def test_json_to_dict_non_dict_or_empty_content(self):
+        """测试内容为列表、空文件或只有空白时视为失败"""
+        for content in ('[1, 2]', '', '   '):
+            with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+                f.write(content)
+            try:
+                self.assertEqual(json_to_dict(f.name), {})
+
+                target_dict = {"existing": "data"}
+                self.assertFalse(json_to_dict(f.name, target_dict=target_dict))
+                self.assertEqual(target_dict, {"existing": "data"})
+            finally:
+                os.unlink(f.name)
+
     def test_json_to_dict_invalid_target_dict(self):
         """测试无效的target_dict"""
         file_path = os.path.join(self.test_data_dir, 'valid_json.json')
@@ -207,6 +385,57 @@ class TestJsonToDict(unittest.TestCase):
         self.assertEqual(result, {})
 
 
+class TestBulkMerge(unittest.TestCase):
+    """测试 bulk_merge 函数"""
+
+    def setUp(self):
+        self.test_data_dir = os.path.join(os.path.dirname(__file__), 'data')
+        self.valid_path = os.path.join(self.test_data_dir, 'valid_json.json')
+        self.nested_path = os.path.join(self.test_data_dir, 'nested_json.json')
+
+    def test_bulk_merge_return_mode(self):
+        """测试返回模式：合并多个文件"""
+        result = bulk_merge([self.valid_path, self.nested_path])
+
+        self.assertEqual(result["name"], "测试用户")
+        self.assertEqual(result["metadata"]["version"], "1.0.0")
+
+    def test_bulk_merge_update_mode(self):
+        """测试更新模式：部分文件失败时返回False，其余文件仍合并"""
+        target_dict = {"existing": "data"}
+        result = bulk_merge([self.valid_path, "nonexistent.json", self.nested_path], target_dict=target_dict)
+
+        self.assertFalse(result)
+        self.assertEqual(target_dict["existing"], "data")
+        self.assertEqual(target_dict["name"], "测试用户")
+        self.assertIn("user", target_dict)
+
+    def test_bulk_merge_invalid_target_dict(self):
+        """测试无效的target_dict"""
+        self.assertFalse(bulk_merge([self.valid_path], target_dict="invalid"))
+
+
+class TestReadMany(unittest.TestCase):
+    """测试 read_many 函数"""
+
+    def setUp(self):
+        self.test_data_dir = os.path.join(os.path.dirname(__file__), 'data')
+
+    def test_read_many_keeps_order(self):
+        """测试批量读取结果与输入顺序一致，失败项为默认值"""
+        paths = [
+            os.path.join(self.test_data_dir, 'valid_json.json'),
+            "nonexistent.json",
+            os.path.join(self.test_data_dir, 'nested_json.json'),
+        ]
+        results = read_many(paths, max_workers=2)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["name"], "测试用户")
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2]["metadata"]["version"], "1.0.0")
+
+
 class TestIntegration(unittest.TestCase):
     """集成测试：读写组合测试"""
 
@@ -239,6 +468,17 @@ class TestIntegration(unittest.TestCase):
         dict_result = json_to_dict(file_path)
         self.assertEqual(dict_result, original_data)
 
+    def test_read_write_cycle_keeps_nan_and_big_int(self):
+        """测试 NaN 与超出 64 位的整数读写后保持不变"""
+        original_data = {"nan": float('nan'), "id": 2 ** 70 + 1}
+        file_path = os.path.join(self.temp_dir, 'special_numbers.json')
+        self.assertTrue(xiervjson(original_data, file_path))
+
+        for result in (read_json_to_dict(file_path), json_to_dict(file_path)):
+            self.assertTrue(math.isnan(result["nan"]))
+            self.assertEqual(result["id"], 2 ** 70 + 1)
+            self.assertIsInstance(result["id"], int)
+
     def test_update_existing_dict(self):
         """测试更新现有字典"""
         file_path = os.path.join(self.test_data_dir, 'valid_json.json')